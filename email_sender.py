@@ -1,18 +1,32 @@
+import io
 import os
 import re
+import atexit
+import copy
+import binascii
 import logging
+import configparser
+import ssl
+import socket
 import smtplib
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.image import MIMEImage
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import Any, Tuple, List, Dict, Optional, Union, Generator
-from jinja2 import Environment, FileSystemLoader
-from contextlib import contextmanager
+from email.charset import Charset, QP
+from email.generator import BytesGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Tuple, List, Dict, Optional, Union, Generator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from functools import lru_cache
+from functools import lru_cache, partial
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from jinja2.runtime import Macro
+
+# UTF-8 with quoted-printable bodies, mostly-ASCII text stays close to its original size
+_UTF8_QP = Charset('utf-8')
+_UTF8_QP.body_encoding = QP
 
 # Set logging
 logging.basicConfig(
@@ -37,6 +51,200 @@ class SMTPConnectionError(EmailError):
     """Exception class to handle SMTP connection errors."""
     pass
 
+class _SMTPDataWriter(io.RawIOBase):
+    """Write-only stream that dot-stuffs SMTP DATA and sends it straight to a socket."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self.at_line_start = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        data = bytes(data)
+        if not data:
+            return 0
+
+        # Lines starting with a period get an extra one, as smtplib does for sendmail
+        stuffed = data.replace(b'\n.', b'\n..')
+        if self.at_line_start and data.startswith(b'.'):
+            stuffed = b'.' + stuffed
+
+        self._sock.sendall(stuffed)
+        self.at_line_start = data.endswith(b'\n')
+        return len(data)
+
+class _FrozenDict(tuple):
+    """Hashable, immutable stand-in for a dict, used to build render cache keys."""
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple.__hash__(self)))
+
+class _FrozenScalar(_FrozenDict):
+    """A (type, value) pair, so values that compare equal across types (1, 1.0, True) stay distinct keys."""
+    __slots__ = ()
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists into hashable tuples.
+
+    Args:
+        value (Any): Value to freeze
+
+    Returns:
+        Any: `_FrozenDict` for dicts, tuple for lists and tuples, the value itself for
+        strings and a type-tagged `_FrozenScalar` for anything else
+    """
+    if isinstance(value, dict):
+        return _FrozenDict((_freeze(key), _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if type(value) is str:
+        return value
+    return _FrozenScalar((type(value), value))
+
+def _thaw(value: Any) -> Any:
+    """
+    Reverse `_freeze`, turning frozen values back into dicts, lists and plain scalars.
+
+    Args:
+        value (Any): Value to thaw
+
+    Returns:
+        Any: dict for `_FrozenDict`, list for tuples, the original value for `_FrozenScalar`
+    """
+    if isinstance(value, _FrozenScalar):
+        return value[1]
+    if isinstance(value, _FrozenDict):
+        return {_thaw(key): _thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+# Parsed config sections, keyed by (path, section) and invalidated by file mtime and size
+_CFG_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+def load_smtp_configs(path: str = 'config.ini', section: str = 'SMTP') -> Dict[str, str]:
+    """
+    Load SMTP settings from an ini file, caching the parsed section until the file changes.
+
+    Args:
+        path (str): Path to the ini file
+        section (str): Section holding the SMTP settings
+
+    Returns:
+        Dict[str, str]: SMTP configuration dictionary
+
+    Raises:
+        DataRetrievalError: If the file or section cannot be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise DataRetrievalError(f"Failed to read config file {path}: {e}")
+
+    # Nanosecond mtime plus size, like the image cache, so quick successive edits are seen
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _CFG_CACHE.get((path, section))
+    if cached and cached[0] == version:
+        return cached[1].copy()
+
+    ini_configs = configparser.ConfigParser()
+    ini_configs.read(path)
+    try:
+        configs = dict(ini_configs.items(section))
+    except configparser.NoSectionError as e:
+        raise DataRetrievalError(f"Failed to read config file {path}: {e}")
+
+    _CFG_CACHE[(path, section)] = (version, configs)
+    return configs.copy()
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the TLS context shared by every SMTP connection.
+
+    Built on first use and reused afterwards instead of once per connection. It is the
+    same context `smtplib.SMTP_SSL` creates when none is given, so certificates are not
+    verified and relays with self-signed or private-CA certificates keep working.
+
+    Returns:
+        ssl.SSLContext: smtplib's default client-side TLS context
+    """
+    return ssl._create_stdlib_context()
+
+@lru_cache(maxsize=1)
+def get_template_env() -> 'Environment':
+    """
+    Create and configure the Jinja2 environment with custom filters.
+
+    The environment is built once per process and shared by every EmailSender,
+    so the template loader and compiled templates are reused across instances.
+
+    Returns:
+        Environment: Configured Jinja2 environment
+    """
+    # Imported here so plain emails never pay for loading Jinja2
+    from jinja2 import Environment, FileSystemLoader
+
+    template_dir = Path(__file__).parent
+    # Templates ship with the package, so skip the per-lookup auto-reload stat and never evict them
+    env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False, cache_size=-1)
+
+    # Add custom filters
+    def format_date(value: str, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+        """Convert string date to formatted string."""
+        if isinstance(value, str):
+            try:
+                date_obj = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+                return date_obj.strftime(fmt)
+            except ValueError:
+                return value
+        return value
+
+    def default_date(value: Optional[str] = None, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+        """Return current date if value is None."""
+        if value is None:
+            return datetime.now().strftime(fmt)
+        return value
+
+    env.filters['date'] = format_date
+    env.filters['default_date'] = default_date  # Added missing filter
+    env.globals['now'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    return env
+
+@lru_cache(maxsize=8)
+def _get_template(name: str) -> 'Template':
+    """
+    Get a compiled template from the shared environment, skipping Jinja2's lookup on reuse.
+
+    Args:
+        name (str): Template path relative to the package directory
+
+    Returns:
+        Template: The compiled template
+    """
+    return get_template_env().get_template(name)
+
+@lru_cache(maxsize=1)
+def get_row_macro() -> 'Macro':
+    """
+    Get the compiled table row macro from `template/row_macro.html`.
+
+    Returns:
+        Macro: Callable rendering one table row from (data, headers, index)
+    """
+    return _get_template('template/row_macro.html').module.row
+
 class EmailSender:
     """A class to handle email sending operations with various features like templates and attachments.
 
@@ -48,12 +256,14 @@ class EmailSender:
         IMAGE_EXTENSIONS (set): Supported image file extensions
         EMAIL_REGEX (Pattern): Regular expression for email validation
         ALERT_COLORS (Dict[str, str]): Color mapping for different alert types
+        RGBA_OPACITIES (tuple): Opacities whose rgba alert colors are precomputed
         REQUIRED_SMTP_PARAMS (set): Required SMTP configuration parameters
     """
 
     # Class constants
     IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
-    EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    # Domain of at most 253 characters, made of 1-63 character labels
+    EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@(?=.{1,253}\Z)(?:[a-zA-Z0-9-]{1,63}\.)+[a-zA-Z]{2,63}')
     ALERT_COLORS = {
         'success': '#28a745',
         'warning': '#ffc107',
@@ -61,8 +271,16 @@ class EmailSender:
         'info': '#17a2b8'
     }
     REQUIRED_SMTP_PARAMS = {'server', 'port'}
-
-    def __init__(self, smtp_configs: Dict[str, str]):
+    RGBA_OPACITIES = (0.1, 0.125, 0.15, 0.2, 1.0)
+    ATTACHMENT_BUFFER_SIZE = 65536
+    # A multiple of 57 bytes, so every chunk encodes to whole 76-character base64 lines
+    ATTACHMENT_CHUNK_SIZE = ATTACHMENT_BUFFER_SIZE - ATTACHMENT_BUFFER_SIZE % 57
+    # Longest line allowed in a 7bit body (RFC 5321, 1000 including CRLF)
+    MAX_LINE_LENGTH = 998
+    # Messages with a part larger than this are streamed to the socket instead of serialized up front
+    STREAM_THRESHOLD = 4 * 1024 * 1024
+
+    def __init__(self, smtp_configs: Dict[str, str], keep_alive: bool = False):
         """
         Initialize EmailSender with SMTP configurations.
 
@@ -72,18 +290,43 @@ class EmailSender:
                 - port (str): SMTP server port
                 - username (str, optional): SMTP username
                 - password (str, optional): SMTP password
+            keep_alive (bool): Keep one authenticated SMTP session open across sends,
+                checked with NOOP before each use and closed by `close()` or at exit
         """
         self._smtp_configs = smtp_configs
         self._validate_config()
 
-        # Initialize the template environment during object creation
-        self._template_env = self._create_jinja2_environment()
+        # Long-lived SMTP session, only used when keep_alive is enabled
+        self._keep_alive = keep_alive
+        self._session: Optional[smtplib.SMTP] = None
+
+        # The shared template environment is loaded on first use
+        self._template_env = None
+
+        # Messages built during send_many, keyed by body and attachments
+        self._message_cache: Optional[Dict[Tuple[str, bool, Tuple[str, ...]], MIMEMultipart]] = None
+
+        # Cache rendered alerts, keyed by the frozen template context
+        self._render_alert = lru_cache(maxsize=128)(self._render_alert)
 
     @property
     def smtp_configs(self) -> Dict[str, str]:
         """Get the current SMTP configuration."""
         return self._smtp_configs.copy()
 
+    def __enter__(self) -> 'EmailSender':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the kept-alive SMTP session, if one is open."""
+        # Drop the exit hook so a closed sender can be garbage collected
+        atexit.unregister(self.close)
+        session, self._session = self._session, None
+        self._cleanup_connection(session)
+
     def update_smtp_config(self, new_config: Dict[str, str]) -> None:
         """
         Update SMTP configuration with new settings.
@@ -108,6 +351,9 @@ class EmailSender:
             self._smtp_configs = self._smtp_configs.copy()
             raise e
 
+        # A kept-alive session belongs to the old settings
+        self.close()
+
     def _validate_config(self) -> None:
         """
         Validate SMTP configuration parameters.
@@ -120,22 +366,26 @@ class EmailSender:
             InvalidDataFormatError: If parameters are in invalid format
         """
         # Check for missing parameters
-        missing_params = self.REQUIRED_SMTP_PARAMS - set(self.smtp_configs.keys())
+        configs = self._smtp_configs
+        missing_params = self.REQUIRED_SMTP_PARAMS - set(configs.keys())
         if missing_params:
             raise DataRetrievalError(f"Missing required parameters: {missing_params}")
 
         # Validate port is numeric
         try:
-            port = int(self.smtp_configs['port'])
+            port = int(configs['port'])
             if port <= 0:
                 raise InvalidDataFormatError("Port must be a positive number")
         except ValueError:
             raise InvalidDataFormatError("Port must be a valid number")
 
         # Validate server is not empty
-        if not self.smtp_configs['server'].strip():
+        if not configs['server'].strip():
             raise InvalidDataFormatError("Server address cannot be empty")
 
+        # Keep the parsed port so connecting does not reparse it every time
+        self._port = port
+
     @contextmanager
     def _smtp_connection(self) -> Generator[smtplib.SMTP, None, None]:
         """
@@ -147,6 +397,16 @@ class EmailSender:
         Raises:
             SMTPConnectionError: If connection fails.
         """
+        if self._keep_alive:
+            smtp_server = self._ensure_session()
+            try:
+                yield smtp_server
+            except Exception:
+                # The session state is unknown after a failure, reconnect next time
+                self.close()
+                raise
+            return
+
         smtp_server = None
         try:
             smtp_server = self._connect_smtp()
@@ -154,19 +414,66 @@ class EmailSender:
         finally:
             self._cleanup_connection(smtp_server)
 
+    def _ensure_session(self) -> smtplib.SMTP:
+        """
+        Get the kept-alive SMTP session, reconnecting if the server dropped it.
+
+        Returns:
+            smtplib.SMTP: A live SMTP connection
+
+        Raises:
+            SMTPConnectionError: If connection fails
+        """
+        if self._session is not None:
+            try:
+                if self._session.noop()[0] == 250:
+                    return self._session
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._session.close()
+            self._session = None
+
+        self._session = self._connect_smtp()
+        # Only hold the sender from atexit while a session is open; unregister
+        # first so a reconnect doesn't stack a second hook
+        atexit.unregister(self.close)
+        atexit.register(self.close)
+        return self._session
+
+    @contextmanager
+    def _smtp_session(self, server: Optional[smtplib.SMTP] = None) -> Generator[smtplib.SMTP, None, None]:
+        """
+        Context manager that reuses an already-open SMTP connection, or opens a new one.
+
+        Args:
+            server (Optional[smtplib.SMTP]): Open connection to reuse; left open on exit
+
+        Yields:
+            smtplib.SMTP: The SMTP connection object.
+        """
+        if server is not None:
+            yield server
+        else:
+            with self._smtp_connection() as smtp_server:
+                yield smtp_server
+
     @staticmethod
-    @lru_cache(maxsize=100)
+    @lru_cache(maxsize=4096)
     def is_valid_email(email: str) -> bool:
         """
         Validate an email address using regex with caching.
 
+        The local part may only hold letters, digits and `._%+-`; the domain needs
+        at least two labels of letters, digits or hyphens, each at most 63 characters,
+        at most 253 characters in total, and an alphabetic TLD of two or more letters.
+
         Args:
             email (str): Email address to validate
 
         Returns:
             bool: True if email is valid, False otherwise
         """
-        return bool(EmailSender.EMAIL_REGEX.match(email))
+        return EmailSender.EMAIL_REGEX.fullmatch(email) is not None
 
     @staticmethod
     def is_image_file(filepath: str) -> bool:
@@ -179,7 +486,7 @@ class EmailSender:
         Returns:
             bool: True if file is an image, False otherwise
         """
-        return Path(filepath).suffix.lower() in EmailSender.IMAGE_EXTENSIONS
+        return os.path.splitext(filepath)[1].lower() in EmailSender.IMAGE_EXTENSIONS
 
     def _connect_smtp(self) -> smtplib.SMTP:
         """
@@ -192,13 +499,14 @@ class EmailSender:
             SMTPConnectionError: If connection fails
         """
         try:
-            server = self.smtp_configs['server']
-            port = int(self.smtp_configs['port'])
-            username = self.smtp_configs.get('username')
-            password = self.smtp_configs.get('password')
+            configs = self._smtp_configs
+            server = configs['server']
+            port = self._port
+            username = configs.get('username')
+            password = configs.get('password')
 
             if username and password:
-                smtp_server = smtplib.SMTP_SSL(server, port)
+                smtp_server = smtplib.SMTP_SSL(server, port, context=get_ssl_context())
                 smtp_server.login(username, password)
             else:
                 smtp_server = smtplib.SMTP(server, port)
@@ -212,31 +520,109 @@ class EmailSender:
         """
         Attach a file to the email message.
 
+        Missing files are expected to be filtered out beforehand with `_existing_attachments`.
+
         Args:
             msg (MIMEMultipart): Email message object
             file_path (str): Path to file to attach
         """
-        if not Path(file_path).exists():
-            logger.warning(f"Attachment not found: {file_path}")
-            return
+        # Resolve the file name and extension once instead of building Path objects per use
+        name = os.path.basename(file_path)
+        suffix = os.path.splitext(name)[1].lower()
 
         try:
-            if self.is_image_file(file_path):
-                with open(file_path, 'rb') as img:
-                    part = MIMEImage(img.read())
-                    part.add_header('Content-ID', f"<{Path(file_path).name}>")
-                    part.add_header('Content-Disposition', 'inline', filename=Path(file_path).name)
+            if suffix in self.IMAGE_EXTENSIONS:
+                part = MIMEBase('image', 'jpeg' if suffix in ('.jpg', '.jpeg') else suffix[1:])
+                part.set_payload(self._encode_image_base64(file_path))
+                part['Content-Transfer-Encoding'] = 'base64'
+                part.add_header('Content-ID', f"<{name}>")
+                part.add_header('Content-Disposition', 'inline', filename=name)
             else:
-                with open(file_path, 'rb') as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-                    encoders.encode_base64(part)
-                    part.add_header('Content-Disposition', f"attachment; filename= {Path(file_path).name}")
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(self._encode_file_base64(file_path))
+                part['Content-Transfer-Encoding'] = 'base64'
+                part.add_header('Content-Disposition', f"attachment; filename= {name}")
 
             msg.attach(part)
         except IOError as e:
             logger.error(f"Failed to attach file {file_path}: {e}")
 
+    @staticmethod
+    def _existing_attachments(attachment_paths: Optional[List[str]]) -> List[str]:
+        """
+        Keep only the attachments that exist, checking each file with a single stat.
+
+        Args:
+            attachment_paths (Optional[List[str]]): List of file paths to attach
+
+        Returns:
+            List[str]: The attachment paths that point to existing files
+        """
+        existing = []
+        for file_path in attachment_paths or []:
+            if os.path.isfile(file_path):
+                existing.append(file_path)
+            else:
+                logger.warning(f"Attachment not found: {file_path}")
+        return existing
+
+    @classmethod
+    def _encode_file_base64(cls, file_path: str) -> str:
+        """
+        Base64-encode a file with buffered, chunked reads.
+
+        Each 57-byte slice is encoded by `binascii.b2a_base64` into one 76-character
+        line, using memoryview slices so the chunk is never copied.
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            str: Base64 payload wrapped in 76-character lines
+        """
+        encode = binascii.b2a_base64
+        encoded = io.BytesIO()
+        with open(file_path, 'rb', buffering=cls.ATTACHMENT_BUFFER_SIZE) as attachment:
+            for chunk in iter(partial(attachment.read, cls.ATTACHMENT_CHUNK_SIZE), b''):
+                view = memoryview(chunk)
+                encoded.write(b''.join([encode(view[start:start + 57]) for start in range(0, len(chunk), 57)]))
+        return encoded.getvalue().decode('ascii')
+
+    @classmethod
+    def _encode_image_base64(cls, file_path: str) -> str:
+        """
+        Base64-encode an image, reusing the result while the file is unchanged.
+
+        Inline images such as logos are usually the same file on every send, so their
+        encoded payload is cached by path, modification time and size.
+
+        Args:
+            file_path (str): Path to the image
+
+        Returns:
+            str: Base64 payload wrapped in 76-character lines
+        """
+        stat = os.stat(file_path)
+        return cls._cached_image_base64(file_path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _cached_image_base64(file_path: str, mtime_ns: int, size: int) -> str:
+        """
+        Base64-encode an image, cached per (path, mtime, size) by `_encode_image_base64`.
+
+        Only the immutable payload string is cached, each send still gets its own MIME part.
+
+        Args:
+            file_path (str): Path to the image
+            mtime_ns (int): Modification time of the file, in nanoseconds
+            size (int): Size of the file in bytes
+
+        Returns:
+            str: Base64 payload wrapped in 76-character lines
+        """
+        return EmailSender._encode_file_base64(file_path)
+
     @staticmethod
     def get_rgba_color(hex_color: str, opacity: float = 1.0) -> str:
         """
@@ -255,45 +641,31 @@ class EmailSender:
         b = int(hex_color[4:6], 16)
         return f"rgba({r}, {g}, {b}, {opacity})"
 
-    @property
-    def template_env(self) -> Environment:
-        """Get the Jinja2 template environment."""
-        if self._template_env is None:
-            self._template_env = self._create_jinja2_environment()
-        return self._template_env
-
-    def _create_jinja2_environment(self) -> Environment:
-        """
-        Create and configure Jinja2 environment with custom filters.
-
-        Returns:
-            Environment: Configured Jinja2 environment
+    @staticmethod
+    def rgba_for(alert_type: str, opacity: float = 1.0) -> str:
         """
-        template_dir = Path(__file__).parent
-        env = Environment(loader=FileSystemLoader(template_dir))
+        Get the rgba variant of an alert type's color.
 
-        # Add custom filters
-        def format_date(value: str, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
-            """Convert string date to formatted string."""
-            if isinstance(value, str):
-                try:
-                    date_obj = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                    return date_obj.strftime(fmt)
-                except ValueError:
-                    return value
-            return value
+        Common opacities are looked up from a table precomputed at import time,
+        anything else falls back to `get_rgba_color`.
 
-        def default_date(value: Optional[str] = None, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
-            """Return current date if value is None."""
-            if value is None:
-                return datetime.now().strftime(fmt)
-            return value
+        Args:
+            alert_type (str): Type of alert
+            opacity (float): Opacity value between 0 and 1
 
-        env.filters['date'] = format_date
-        env.filters['default_date'] = default_date  # Added missing filter
-        env.globals['now'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        Returns:
+            str: RGBA color string
+        """
+        return _RGBA_CACHE.get(alert_type, {}).get(opacity) or EmailSender.get_rgba_color(
+            EmailSender.ALERT_COLORS.get(alert_type, '#333333'), opacity
+        )
 
-        return env
+    @property
+    def template_env(self) -> 'Environment':
+        """Get the Jinja2 template environment."""
+        if self._template_env is None:
+            self._template_env = get_template_env()
+        return self._template_env
 
     def _validate_alert_type(self, alert_type: str) -> None:
         """
@@ -358,11 +730,9 @@ class EmailSender:
         """
         self._validate_alert_type(alert_type)
         alert_color = self.ALERT_COLORS[alert_type]
-        template = self.template_env.get_template('./template/alert_template.html')
-
         table_headers = list(table_data[0].keys()) if table_data else None
 
-        return template.render(
+        context = _freeze(dict(
             html_title='Alert Notification',
             alert_type=alert_type,
             alert_title=alert_title,
@@ -370,6 +740,7 @@ class EmailSender:
             file_names=file_names,
             alert_link=alert_link,
             alert_color=alert_color,
+            alert_tint=self.rgba_for(alert_type, 0.125),
             table_headers=table_headers,
             table_data=table_data,
             company_logo=company_logo,
@@ -383,8 +754,40 @@ class EmailSender:
             action_button=action_button,
             environment=environment,
             timestamp=timestamp
+        ))
+
+        try:
+            hash(context)
+        except TypeError:
+            # Context holds unhashable values, render it without caching
+            return self._render_alert.__wrapped__(context)
+        return self._render_alert(context)
+
+    def _render_alert(self, context: '_FrozenDict') -> str:
+        """
+        Render the alert template for a frozen template context.
+
+        Wrapped in an LRU cache per instance, so repeated alerts with identical
+        parameters are served without re-rendering the template.
+
+        Args:
+            context (_FrozenDict): Template variables, as produced by `_freeze`
+
+        Returns:
+            str: Rendered HTML template
+        """
+        context = _thaw(context)
+        template = _get_template('template/alert_template.html')
+
+        # Only the row loop varies between tables, so rows go through the compiled macro
+        row = get_row_macro()
+        headers = context['table_headers']
+        rows_html = ''.join(
+            row(data, headers, index) for index, data in enumerate(context['table_data'] or [], 1)
         )
 
+        return template.render(rows_html=rows_html, **context)
+
     def send_email(
         self,
         to: Union[str, List[str]],
@@ -394,7 +797,8 @@ class EmailSender:
         attachment_paths: Optional[List[str]] = None,
         cc: Optional[List[str]] = None,
         bcc: Optional[List[str]] = None,
-        from_address: Optional[str] = None
+        from_address: Optional[str] = None,
+        server: Optional[smtplib.SMTP] = None
     ) -> bool:
         """
         Send an email with optional attachments.
@@ -408,41 +812,460 @@ class EmailSender:
             cc (Optional[List[str]]): CC recipients
             bcc (Optional[List[str]]): BCC recipients
             from_address (Optional[str]): Sender email address
+            server (Optional[smtplib.SMTP]): Open SMTP connection to reuse instead of connecting
 
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
-        attachment_paths = attachment_paths or []
+        try:
+            # Assemble and serialize everything before connecting, so the SMTP
+            # session is only held open for the actual transfer
+            prepared = self._prepare_email(
+                to, subject, message_body, html_body, attachment_paths, cc, bcc, from_address
+            )
+
+            with self._smtp_session(server) as server:
+                self._deliver_email(server, prepared)
+
+            logger.info("Email sent successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to send email: {str(e)}")
+            return False
+
+    def _prepare_email(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        message_body: str,
+        html_body: bool = False,
+        attachment_paths: Optional[List[str]] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        from_address: Optional[str] = None
+    ) -> Tuple[MIMEMultipart, str, List[str], Optional[bytes]]:
+        """
+        Build an email and serialize it for sending, without touching the SMTP server.
+
+        Takes the same arguments as `_build_message`.
+
+        Returns:
+            Tuple[MIMEMultipart, str, List[str], Optional[bytes]]: The message, the envelope
+                sender, all recipients and the serialized message, or None if it is too
+                large and has to be streamed
+        """
+        msg, username, all_recipients = self._build_message(
+            to, subject, message_body, html_body, attachment_paths, cc, bcc, from_address
+        )
+        # Messages with large attachments are streamed instead of materialized
+        stream = self._largest_part_size(msg) > self.STREAM_THRESHOLD
+        payload = None if stream else self._serialize_message(msg)
+        return msg, username, all_recipients, payload
+
+    def _deliver_email(
+        self,
+        server: smtplib.SMTP,
+        prepared: Tuple[MIMEMultipart, str, List[str], Optional[bytes]]
+    ) -> None:
+        """
+        Send an email prepared with `_prepare_email` over an open SMTP connection.
+
+        Args:
+            server (smtplib.SMTP): Open SMTP connection
+            prepared (Tuple[MIMEMultipart, str, List[str], Optional[bytes]]): Output of `_prepare_email`
+        """
+        msg, username, all_recipients, payload = prepared
+        if payload is None:
+            self._stream_message(server, username, msg, all_recipients)
+        else:
+            self._send_message(server, username, payload, all_recipients)
+
+    def _build_message(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        message_body: str,
+        html_body: bool = False,
+        attachment_paths: Optional[List[str]] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        from_address: Optional[str] = None
+    ) -> Tuple[MIMEMultipart, str, List[str]]:
+        """
+        Build the MIME message for an email without touching the SMTP server.
+
+        Args:
+            to (Union[str, List[str]]): Recipient email address(es)
+            subject (str): Email subject
+            message_body (str): Email body content
+            html_body (bool): Whether the message body is HTML
+            attachment_paths (Optional[List[str]]): List of file paths to attach
+            cc (Optional[List[str]]): CC recipients
+            bcc (Optional[List[str]]): BCC recipients
+            from_address (Optional[str]): Sender email address
+
+        Returns:
+            Tuple[MIMEMultipart, str, List[str]]: The message, the envelope sender and all recipients
+        """
+        attachment_paths = self._existing_attachments(attachment_paths)
         cc = cc or []
         bcc = bcc or []
 
+        body_key = (message_body, html_body, tuple(attachment_paths))
+        cached_msg = self._message_cache.get(body_key) if self._message_cache is not None else None
+
+        if cached_msg is not None:
+            # Reuse the already encoded body and attachments, only the headers change.
+            # Deleting a header rebinds the header list, leaving the cached message untouched.
+            msg = copy.copy(cached_msg)
+            for header in ('From', 'To', 'Subject', 'Cc'):
+                del msg[header]
+        else:
+            msg = MIMEMultipart()
+            msg.attach(self._build_body(message_body, html_body))
+
+            for attachment_path in attachment_paths:
+                self._attach_file(msg, attachment_path)
+
+            if self._message_cache is not None:
+                self._message_cache[body_key] = msg
+
+        username = from_address if from_address and self.is_valid_email(from_address) else self._smtp_configs.get('username')
+
+        msg['From'] = username
+        msg['To'] = to if isinstance(to, str) else ', '.join(to)
+        msg['Subject'] = subject
+
+        # Bcc recipients only go in the envelope, a Bcc header would disclose them to everyone
+        if cc:
+            msg['Cc'] = ', '.join(cc)
+
+        all_recipients = (to if isinstance(to, list) else [to]) + cc + bcc
+
+        return msg, username, all_recipients
+
+    @classmethod
+    def _build_body(cls, message_body: str, html_body: bool = False) -> MIMEText:
+        """
+        Build the text part of an email with the cheapest suitable transfer encoding.
+
+        Pure ASCII bodies whose lines fit SMTP's limit are sent as-is in 7bit, anything
+        else as UTF-8 quoted-printable, which keeps mostly-ASCII HTML readable and
+        smaller than base64.
+
+        Args:
+            message_body (str): Email body content
+            html_body (bool): Whether the message body is HTML
+
+        Returns:
+            MIMEText: The body part
+        """
+        subtype = 'html' if html_body else 'plain'
+        if message_body.isascii() and max(map(len, message_body.splitlines()), default=0) <= cls.MAX_LINE_LENGTH:
+            return MIMEText(message_body, subtype, 'us-ascii')
+        return MIMEText(message_body, subtype, _UTF8_QP)
+
+    @staticmethod
+    def _send_message(
+        server: smtplib.SMTP,
+        username: str,
+        payload: bytes,
+        recipients: List[str]
+    ) -> None:
+        """
+        Send a serialized message over an open SMTP connection.
+
+        Args:
+            server (smtplib.SMTP): Open SMTP connection
+            username (str): Envelope sender address
+            payload (bytes): Message serialized with `_serialize_message`
+            recipients (List[str]): Envelope recipients
+        """
+        server.sendmail(username, recipients, payload)
+
+    @staticmethod
+    def _largest_part_size(msg: MIMEMultipart) -> int:
+        """
+        Get the size of the largest encoded part of a message.
+
+        Args:
+            msg (MIMEMultipart): Message to inspect
+
+        Returns:
+            int: Length of the largest part payload
+        """
+        return max((len(part.get_payload()) for part in msg.get_payload()), default=0)
+
+    @classmethod
+    def _stream_message(
+        cls,
+        server: smtplib.SMTP,
+        username: str,
+        msg: MIMEMultipart,
+        recipients: List[str]
+    ) -> None:
+        """
+        Send a message by streaming it straight to the SMTP socket.
+
+        Drives MAIL/RCPT/DATA by hand and flattens the message with a BytesGenerator
+        through a buffered, dot-stuffing writer, so the serialized message is never
+        held in memory as a whole.
+
+        Args:
+            server (smtplib.SMTP): Open SMTP connection
+            username (str): Envelope sender address
+            msg (MIMEMultipart): Message to send
+            recipients (List[str]): Envelope recipients
+
+        Raises:
+            smtplib.SMTPException: If the server rejects the sender, all recipients or the data
+        """
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(username)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, username)
+
+        refused = {}
+        for recipient in recipients:
+            code, resp = server.rcpt(recipient)
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+        if len(refused) == len(recipients):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        for recipient, (code, resp) in refused.items():
+            logger.warning(f"Recipient refused: {recipient} ({code} {resp!r})")
+
+        code, resp = server.docmd('DATA')
+        if code != 354:
+            raise smtplib.SMTPDataError(code, resp)
+
+        writer = _SMTPDataWriter(server.sock)
+        with io.BufferedWriter(writer, buffer_size=cls.ATTACHMENT_BUFFER_SIZE) as fp:
+            BytesGenerator(fp, mangle_from_=False, policy=msg.policy.clone(linesep='\r\n')).flatten(msg)
+
+        # The terminating period must bypass the dot-stuffing writer
+        server.send(b'.\r\n' if writer.at_line_start else b'\r\n.\r\n')
+
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+
+    @staticmethod
+    def _serialize_message(msg: MIMEMultipart) -> bytes:
+        """
+        Serialize a message once, straight to the bytes sent on the wire.
+
+        smtplib transmits bytes as-is, so the message is rendered with CRLF line endings.
+
+        Args:
+            msg (MIMEMultipart): Message to serialize
+
+        Returns:
+            bytes: The serialized message
+        """
+        return msg.as_bytes(policy=msg.policy.clone(linesep='\r\n'))
+
+    def send_many(self, jobs: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several regular and/or template emails over a single SMTP connection.
+
+        Jobs containing a `report_config` key are sent like `send_template_email`,
+        all others like `send_email`. Every template is rendered and every message
+        built and serialized before connecting, so the connection is only held for
+        the transfers. The mail transaction is reset with RSET between messages, so
+        the connection is reused without reconnecting. Jobs sharing the same body
+        and attachments reuse the MIME parts built for the first of them, so
+        attachments are read and encoded only once.
+
+        Args:
+            jobs (List[Dict[str, Any]]): Keyword arguments for `send_email` or `send_template_email`
+
+        Returns:
+            List[bool]: Per-job success flags, in the same order as `jobs`
+        """
+        results = [False] * len(jobs)
+        prepared = []
+        self._message_cache = {}
+        try:
+            for index, job in enumerate(jobs):
+                try:
+                    if 'report_config' in job:
+                        job = dict(job)
+                        report_config = job.pop('report_config')
+                        attachment_paths = job.pop('attachment_paths', None)
+                        job = self._template_email_details(
+                            report_config, self.generate_alert(**job), attachment_paths
+                        )
+                    prepared.append((index, self._prepare_email(**job)))
+                except Exception as e:
+                    logger.error(f"Failed to build email: {str(e)}")
+        finally:
+            self._message_cache = None
+
+        if not prepared:
+            return results
+
         try:
             with self._smtp_connection() as server:
-                msg = MIMEMultipart()
-                username = from_address if from_address and self.is_valid_email(from_address) else self.smtp_configs.get('username')
+                for position, (index, message) in enumerate(prepared):
+                    if position:
+                        server.rset()
+                    try:
+                        self._deliver_email(server, message)
+                    except Exception as e:
+                        logger.error(f"Failed to send email: {str(e)}")
+                        continue
+                    results[index] = True
+                    logger.info("Email sent successfully")
+        except Exception as e:
+            logger.error(f"Failed to send emails: {str(e)}")
+
+        return results
+
+    @asynccontextmanager
+    async def _async_smtp_connection(self) -> AsyncGenerator[Any, None]:
+        """
+        Async context manager for aiosmtplib connections.
 
-                msg['From'] = username
-                msg['To'] = to if isinstance(to, str) else ', '.join(to)
-                msg['Subject'] = subject
+        Yields:
+            aiosmtplib.SMTP: The connected (and authenticated, if credentials are set) client.
 
-                if cc:
-                    msg['Cc'] = ', '.join(cc)
-                if bcc:
-                    msg['Bcc'] = ', '.join(bcc)
+        Raises:
+            SMTPConnectionError: If connection fails.
+        """
+        import aiosmtplib
+
+        configs = self._smtp_configs
+        server = configs['server']
+        port = self._port
+        username = configs.get('username')
+        password = configs.get('password')
+
+        use_tls = bool(username and password)
+        client = aiosmtplib.SMTP(
+            hostname=server,
+            port=port,
+            use_tls=use_tls,
+            # Like smtplib.SMTP in the sync path, never upgrade plain connections via STARTTLS
+            start_tls=False if not use_tls else None,
+            tls_context=get_ssl_context() if use_tls else None
+        )
+        try:
+            await client.connect()
+            if username and password:
+                await client.login(username, password)
+        except (aiosmtplib.SMTPException, OSError) as e:
+            client.close()
+            raise SMTPConnectionError(f"Failed to connect to SMTP server: {e}")
 
-                all_recipients = (to if isinstance(to, list) else [to]) + cc + bcc
-                msg.attach(MIMEText(message_body, 'html' if html_body else 'plain', 'utf-8'))
+        try:
+            yield client
+        finally:
+            try:
+                await client.quit()
+            except aiosmtplib.SMTPException as e:
+                logger.error(f"Error closing SMTP connection: {str(e)}")
 
-                for attachment_path in attachment_paths:
-                    self._attach_file(msg, attachment_path)
+    async def send_email_async(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        message_body: str,
+        html_body: bool = False,
+        attachment_paths: Optional[List[str]] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        from_address: Optional[str] = None
+    ) -> bool:
+        """
+        Send an email with optional attachments using aiosmtplib.
 
-                server.sendmail(username, all_recipients, msg.as_string())
-                logger.info("Email sent successfully")
-                return True
+        Takes the same arguments as `send_email`.
 
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        results = await self.send_emails_bulk([{
+            'to': to,
+            'subject': subject,
+            'message_body': message_body,
+            'html_body': html_body,
+            'attachment_paths': attachment_paths,
+            'cc': cc,
+            'bcc': bcc,
+            'from_address': from_address
+        }])
+        return results[0]
+
+    async def send_emails_bulk(
+        self,
+        emails: List[Dict[str, Any]],
+        connections: int = 1
+    ) -> List[bool]:
+        """
+        Send several emails concurrently, sharing SMTP connections between them.
+
+        SMTP is sequential per connection, so messages are sharded round-robin
+        across `connections` clients which run concurrently; each client pays the
+        handshake and login only once for all of its messages.
+
+        Args:
+            emails (List[Dict[str, Any]]): Keyword arguments for `send_email`, one dict per email
+            connections (int): Number of parallel SMTP connections to open
+
+        Returns:
+            List[bool]: Per-email success flags, in the same order as `emails`
+        """
+        # Imported here so sync-only callers never pay for loading asyncio
+        import asyncio
+
+        results = [False] * len(emails)
+        messages = []
+        for index, details in enumerate(emails):
+            try:
+                messages.append((index, self._build_message(**details)))
+            except Exception as e:
+                logger.error(f"Failed to build email: {str(e)}")
+
+        connections = max(1, min(connections, len(messages)))
+        shards = [messages[i::connections] for i in range(connections)]
+        await asyncio.gather(*(self._send_shard_async(shard, results) for shard in shards if shard))
+        return results
+
+    async def _send_shard_async(
+        self,
+        shard: List[Tuple[int, Tuple[MIMEMultipart, str, List[str]]]],
+        results: List[bool]
+    ) -> None:
+        """
+        Send a shard of prebuilt messages over a single aiosmtplib connection.
+
+        Args:
+            shard (List[Tuple[int, Tuple[MIMEMultipart, str, List[str]]]]): Indexed messages to send
+            results (List[bool]): Result list updated in place with the outcome of each message
+        """
+        import asyncio
+
+        try:
+            async with self._async_smtp_connection() as client:
+                outcomes = await asyncio.gather(
+                    *(client.send_message(msg, sender=username, recipients=recipients)
+                      for _, (msg, username, recipients) in shard),
+                    return_exceptions=True
+                )
         except Exception as e:
             logger.error(f"Failed to send email: {str(e)}")
-            return False
+            return
+
+        for (index, _), outcome in zip(shard, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to send email: {str(outcome)}")
+            else:
+                results[index] = True
+                logger.info("Email sent successfully")
 
     def send_template_email(
         self,
@@ -464,7 +1287,8 @@ class EmailSender:
         error_details: Optional[str] = None,
         action_button: Optional[Dict[str, str]] = None,
         environment: Optional[str] = None,
-        timestamp: Optional[str] = None
+        timestamp: Optional[str] = None,
+        server: Optional[smtplib.SMTP] = None
     ) -> bool:
         """
         Send an email notification with a template.
@@ -489,6 +1313,7 @@ class EmailSender:
             action_button (Optional[Dict[str, str]]): Action button config
             environment (Optional[str]): Environment name
             timestamp (Optional[str]): Timestamp for the alert
+            server (Optional[smtplib.SMTP]): Open SMTP connection to reuse instead of connecting
 
         Returns:
             bool: True if email was sent successfully, False otherwise
@@ -514,22 +1339,44 @@ class EmailSender:
                 timestamp=timestamp
             )
 
-            logger.info(f"Sending template email notification to {report_config['to']}")
-
             return self.send_email(
-                report_config['to'],
-                report_config['subject'],
-                message_body,
-                html_body=True,
-                cc=report_config.get('cc'),
-                from_address=report_config.get('from_mail'),
-                attachment_paths=attachment_paths
+                **self._template_email_details(report_config, message_body, attachment_paths),
+                server=server
             )
 
         except Exception as e:
             logger.error(f"Failed to send template email: {str(e)}")
             return False
 
+    @staticmethod
+    def _template_email_details(
+        report_config: Dict[str, Union[str, List[str]]],
+        message_body: str,
+        attachment_paths: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Map a report configuration and a rendered alert to `send_email` keyword arguments.
+
+        Args:
+            report_config (Dict[str, Union[str, List[str]]]): Email report configuration
+            message_body (str): Rendered alert HTML
+            attachment_paths (Optional[List[str]]): List of file paths to attach
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `send_email`
+        """
+        logger.info(f"Sending template email notification to {report_config['to']}")
+
+        return dict(
+            to=report_config['to'],
+            subject=report_config['subject'],
+            message_body=message_body,
+            html_body=True,
+            cc=report_config.get('cc'),
+            from_address=report_config.get('from_mail'),
+            attachment_paths=attachment_paths
+        )
+
     @staticmethod
     def _cleanup_connection(smtp_server: Optional[smtplib.SMTP]) -> None:
         """
@@ -543,3 +1390,9 @@ class EmailSender:
                 smtp_server.quit()
             except smtplib.SMTPException as e:
                 logger.error(f"Error closing SMTP connection: {str(e)}")
+
+# RGBA variants of the alert colors; the set of colors is fixed, so they are computed once
+_RGBA_CACHE = {
+    alert_type: {opacity: EmailSender.get_rgba_color(hex_color, opacity) for opacity in EmailSender.RGBA_OPACITIES}
+    for alert_type, hex_color in EmailSender.ALERT_COLORS.items()
+}
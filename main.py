@@ -1,12 +1,9 @@
-from email_sender import EmailSender
-import configparser
+from email_sender import EmailSender, load_smtp_configs
 
 def main():
 
     # Load configuration settings from ini file
-    ini_configs = configparser.ConfigParser()
-    ini_configs.read('config.ini')
-    smtp_configs = dict(ini_configs.items("SMTP"))
+    smtp_configs = load_smtp_configs()
 
     # Create an instance of EmailSender
     email_sender = EmailSender(smtp_configs)
@@ -73,33 +70,33 @@ def main():
         }
     }
 
-    # Send the regular email
-    email_sender.send_email(**email_details)
-
-    # Send the template email with all new features
-    email_sender.send_template_email(
-        report_config=report_config,
-        alert_type=alert_info['alert_type'],
-        alert_title=alert_info['alert_title'],
-        alert_message=alert_info['alert_message'],
-        attachment_paths=['pdf-sample.pdf'],
-        table_data=table_data,
-        company_logo='logo.png',  # Optional
-        summary_data=summary_data,
-        table_summary=['Total', '','3,800', '00:13:08'],
-        total_records=2,
-        show_pagination=True,
-        file_names=list(file_data.keys()),
-        file_status={name: data['status'] for name, data in file_data.items()},
-        file_metadata={name: data['metadata'] for name, data in file_data.items()},
-        error_details=None,  # Optional, for error cases
-        action_button={
-            'url': 'https://your-dashboard.com',
-            'text': 'View Details'
-        },
-        environment='production',
-        timestamp='2024-01-22 15:30:00'
-    )
+    # Send the regular email and the template email over a single SMTP connection
+    email_sender.send_many([
+        email_details,
+        {
+            'report_config': report_config,
+            'alert_type': alert_info['alert_type'],
+            'alert_title': alert_info['alert_title'],
+            'alert_message': alert_info['alert_message'],
+            'attachment_paths': ['pdf-sample.pdf'],
+            'table_data': table_data,
+            'company_logo': 'logo.png',  # Optional
+            'summary_data': summary_data,
+            'table_summary': ['Total', '','3,800', '00:13:08'],
+            'total_records': 2,
+            'show_pagination': True,
+            'file_names': list(file_data.keys()),
+            'file_status': {name: data['status'] for name, data in file_data.items()},
+            'file_metadata': {name: data['metadata'] for name, data in file_data.items()},
+            'error_details': None,  # Optional, for error cases
+            'action_button': {
+                'url': 'https://your-dashboard.com',
+                'text': 'View Details'
+            },
+            'environment': 'production',
+            'timestamp': '2024-01-22 15:30:00'
+        }
+    ])
 
 if __name__ == "__main__":
     main()